@@ -84,12 +84,12 @@ def main():
         logger.info(f"   Saved: {os.path.basename(path)}")
 
     logger.info("\n5. Querying database...")
+    # get_connection caches the connection; it is closed at exit, not here.
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) as count FROM tasks")
     task_count = cursor.fetchone()[0]
     logger.info(f"   Total tasks in database: {task_count}")
-    conn.close()
 
     logger.info("\n6. Getting all tasks...")
     all_tasks = scheduler.get_all_tasks()
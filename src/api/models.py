@@ -28,6 +28,10 @@ class MemoryCreate(BaseModel):
     session_id: Optional[str] = None
 
 
+class MemoryBulkCreate(BaseModel):
+    items: List[MemoryCreate] = Field(..., min_length=1)
+
+
 class MemoryUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=500)
     content: Optional[str] = Field(None, min_length=1)
@@ -53,6 +57,24 @@ class MemoryResponse(BaseModel):
         from_attributes = True
 
 
+class MemorySearchResult(BaseModel):
+    """Search hit with a content preview instead of the full content blob."""
+
+    id: int
+    title: str
+    preview: str
+    type: str
+    tags: Optional[str]
+    source: Optional[str]
+    created_at: str
+    updated_at: str
+    expires_at: Optional[str]
+    score: float
+
+    class Config:
+        from_attributes = True
+
+
 class MemorySearchRequest(BaseModel):
     keyword: Optional[str] = None
     type: Optional[MemoryType] = None
@@ -62,7 +84,7 @@ class MemorySearchRequest(BaseModel):
 
 
 class SearchResponse(BaseModel):
-    results: List[MemoryResponse]
+    results: List[MemorySearchResult]
     total: int
     limit: int
     offset: int
@@ -8,17 +8,27 @@ from pydantic import BaseModel
 
 from ..models import (
     MemoryCreate,
+    MemoryBulkCreate,
     MemoryUpdate,
     MemoryResponse,
     MemoryType,
     SuccessResponse,
 )
 from ..dependencies import get_db, get_memories_dir, get_db_path
+from ...query.query_engine import bump_stats_generation
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Explicit read column list: SELECT * would also pull the generated
+# title_lc/content_lc/created_epoch columns (see db_init), recomputing
+# them for every row returned.
+_MEMORY_COLUMNS = (
+    "id, type, title, content, tags, source, "
+    "created_at, updated_at, expires_at, score"
+)
+
 
 @router.post("/", response_model=MemoryResponse, status_code=status.HTTP_201_CREATED)
 def create_memory(memory: MemoryCreate, conn: sqlite3.Connection = Depends(get_db)):
@@ -45,9 +55,10 @@ def create_memory(memory: MemoryCreate, conn: sqlite3.Connection = Depends(get_d
         )
         memory_id = cursor.lastrowid
         conn.commit()
+        bump_stats_generation()
 
         result = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         if not result:
@@ -64,6 +75,55 @@ def create_memory(memory: MemoryCreate, conn: sqlite3.Connection = Depends(get_d
         )
 
 
+@router.post("/bulk", response_model=List[MemoryResponse])
+def create_memories_bulk(
+    bulk: MemoryBulkCreate, conn: sqlite3.Connection = Depends(get_db)
+):
+    try:
+        now = datetime.now().isoformat()
+
+        rows = [
+            (
+                memory.type.value,
+                memory.title,
+                memory.content,
+                ",".join(memory.tags) if memory.tags else None,
+                memory.source or "api",
+                now,
+                now,
+                memory.expires_at.isoformat() if memory.expires_at else None,
+            )
+            for memory in bulk.items
+        ]
+
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        cursor.executemany(
+            """
+            INSERT INTO memories (type, title, content, tags, source, created_at, updated_at, expires_at, score)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0.0)
+            """,
+            rows,
+        )
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        conn.commit()
+        bump_stats_generation()
+
+        # Single transaction + single writer: the inserted ids are contiguous.
+        first_id = last_id - len(rows) + 1
+        results = conn.execute(
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id BETWEEN ? AND ? ORDER BY id",
+            (first_id, last_id),
+        ).fetchall()
+
+        return [dict(row) for row in results]
+    except Exception as e:
+        logger.error(f"Error bulk creating memories: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
 @router.get("/", response_model=List[MemoryResponse])
 def list_memories(
     memory_type: Optional[MemoryType] = None,
@@ -72,7 +132,7 @@ def list_memories(
     conn: sqlite3.Connection = Depends(get_db),
 ):
     try:
-        query = "SELECT * FROM memories WHERE 1=1"
+        query = f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE 1=1"
         params = []
 
         if memory_type:
@@ -95,7 +155,7 @@ def list_memories(
 def get_memory(memory_id: str, conn: sqlite3.Connection = Depends(get_db)):
     try:
         result = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         if not result:
@@ -121,7 +181,7 @@ def update_memory(
 ):
     try:
         existing = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         if not existing:
@@ -166,9 +226,10 @@ def update_memory(
                 f"UPDATE memories SET {', '.join(updates)} WHERE id = ?", params
             )
             conn.commit()
+        bump_stats_generation()
 
         result = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         return dict(result)
@@ -185,7 +246,7 @@ def update_memory(
 def delete_memory(memory_id: str, conn: sqlite3.Connection = Depends(get_db)):
     try:
         existing = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         if not existing:
@@ -195,6 +256,7 @@ def delete_memory(memory_id: str, conn: sqlite3.Connection = Depends(get_db)):
 
         conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
         conn.commit()
+        bump_stats_generation()
 
         return SuccessResponse(
             success=True, message=f"Memory {memory_id} deleted successfully"
@@ -220,7 +282,7 @@ def update_memory_score(
             )
 
         existing = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         if not existing:
@@ -233,9 +295,10 @@ def update_memory_score(
             (score, datetime.now().isoformat(), memory_id),
         )
         conn.commit()
+        bump_stats_generation()
 
         result = conn.execute(
-            "SELECT * FROM memories WHERE id = ?", (memory_id,)
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,)
         ).fetchone()
 
         return dict(result)
@@ -255,6 +318,7 @@ def cleanup_expired_memories(conn: sqlite3.Connection = Depends(get_db)):
             "DELETE FROM memories WHERE expires_at < datetime('now')"
         ).rowcount
         conn.commit()
+        bump_stats_generation()
 
         return SuccessResponse(
             success=True, message=f"Cleaned up {deleted} expired memories"
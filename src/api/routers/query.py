@@ -14,12 +14,21 @@ from ..models import (
 from ..dependencies import get_db, get_db_path
 from ...query.query_engine import QueryEngine
 
+try:
+    import orjson  # noqa: F401 -- ORJSONResponse needs it at render time
+
+    from fastapi.responses import ORJSONResponse as _SearchResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _SearchResponseClass
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.post("/search", response_model=SearchResponse)
+@router.post(
+    "/search", response_model=SearchResponse, response_class=_SearchResponseClass
+)
 def search_memories(
     request: MemorySearchRequest, conn: sqlite3.Connection = Depends(get_db)
 ):
@@ -45,6 +54,14 @@ def search_memories(
         if params:
             total = conn.execute(total_query, params).fetchone()[0]
 
+        # Ship a bounded preview instead of the full content blob; the bot
+        # renders at most 500 chars per memory anyway.
+        for row in results:
+            content = row.pop("content", "")
+            row["preview"] = (
+                content[:500] + "..." if len(content) > 500 else content
+            )
+
         return SearchResponse(
             results=[dict(r) for r in results],
             total=total,
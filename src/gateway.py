@@ -464,7 +464,7 @@ def result_sender():
 
             for task_id, result in results.items():
                 if task_id in sent:
-                    logger.debug(f"[跳过] 已发送: {task_id}")
+                    logger.debug("[跳过] 已发送: %s", task_id)
                     continue
 
                 response = result.get("response", "")
@@ -574,7 +574,7 @@ def heartbeat_monitor():
                     force_reconnect()
                     connection_error_count = 0
             else:
-                logger.debug(f"[心跳正常] 最后消息 {int(time_since_last_msg)}s 前")
+                logger.debug("[心跳正常] 最后消息 %ds 前", time_since_last_msg)
         except Exception as e:
             logger.error(f"心跳监控异常: {e}")
 
@@ -4,15 +4,35 @@ Memory System Client
 智能记忆系统客户端，提供钉钉机器人与记忆系统的完整集成
 """
 
+import re
 import requests
 import json
 import logging
+from collections import deque
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson未安装时退回标准库json
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
 MEMORY_API_BASE = "http://localhost:8000"
 logger = logging.getLogger(__name__)
 
+# 经验提取的成功/失败模式（预编译，单次扫描代替多次子串查找）
+_SUCCESS_RE = re.compile(r"成功|完成")
+_FAILURE_RE = re.compile(r"错误|失败")
+
 
 class MemorySystemClient:
     """记忆系统客户端"""
@@ -20,6 +40,7 @@ class MemorySystemClient:
     def __init__(self, api_base: str = MEMORY_API_BASE):
         self.api_base = api_base
         self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
 
     def health_check(self) -> bool:
         try:
@@ -46,11 +67,11 @@ class MemorySystemClient:
         try:
             response = self.session.post(
                 f"{self.api_base}/query/search",
-                json={"keyword": keyword, "limit": limit, "hybrid": hybrid},
+                data=_json_dumps({"keyword": keyword, "limit": limit, "hybrid": hybrid}),
                 timeout=10,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get("results", [])
             return []
         except Exception as e:
@@ -88,11 +109,11 @@ class MemorySystemClient:
             }
 
             response = self.session.post(
-                f"{self.api_base}/memories/", json=data, timeout=30
+                f"{self.api_base}/memories/", data=_json_dumps(data), timeout=30
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 logger.info(f"Memory created: {result.get('id')}")
                 return result
             else:
@@ -102,6 +123,67 @@ class MemorySystemClient:
             logger.error(f"Create memory failed: {e}")
             return None
 
+    def create_memories_bulk(
+        self, items: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        批量创建记忆（单次请求）
+
+        Args:
+            items: 记忆字典列表，每项包含 title/content/category/tags，
+                   可选 memory_type（默认 long_term）
+
+        Returns:
+            创建的记忆对象列表，失败项为None
+        """
+        if not items:
+            return []
+
+        payload_items = [
+            {
+                "title": item["title"],
+                "content": item["content"],
+                "type": item.get("memory_type", "long_term"),
+                "category": item.get("category", "context"),
+                "tags": item.get("tags") or [],
+            }
+            for item in items
+        ]
+
+        try:
+            response = self.session.post(
+                f"{self.api_base}/memories/bulk",
+                data=_json_dumps({"items": payload_items}),
+                timeout=30,
+            )
+
+            if response.status_code == 200:
+                results = _json_loads(response.content)
+                logger.info(f"Bulk created {len(results)} memories")
+                return results
+
+            if response.status_code == 404:
+                # 旧版记忆服务没有 /memories/bulk，退回逐条创建
+                logger.warning(
+                    "Bulk endpoint not available, falling back to per-item create"
+                )
+                return [
+                    self.create_memory(
+                        title=item["title"],
+                        content=item["content"],
+                        category=item["category"],
+                        tags=item["tags"],
+                        memory_type=item["type"],
+                    )
+                    for item in payload_items
+                ]
+
+            logger.error(f"Bulk create memories failed: {response.text}")
+            return [None] * len(items)
+        except Exception as e:
+            logger.error(f"Bulk create memories failed: {e}")
+            return [None] * len(items)
+
     def create_experience_memory(
         self,
         title: str,
@@ -144,7 +226,7 @@ class MemorySystemClient:
                 f"{self.api_base}/query/recent", params={"limit": limit}, timeout=5
             )
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             return []
         except Exception as e:
             logger.error(f"Get recent memories failed: {e}")
@@ -155,7 +237,7 @@ class MemorySystemClient:
         try:
             response = self.session.get(f"{self.api_base}/query/statistics", timeout=5)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             return {}
         except Exception as e:
             logger.error(f"Get statistics failed: {e}")
@@ -192,9 +274,12 @@ def format_memories_as_context(
 
     for mem in memories:
         title = mem.get("title", "No title")
-        content = mem.get("content", "")
 
-        content_preview = content[:500] + "..." if len(content) > 500 else content
+        # 服务端已生成preview字段；兼容仍返回完整content的旧版服务
+        content_preview = mem.get("preview")
+        if content_preview is None:
+            content = mem.get("content", "")
+            content_preview = content[:500] + "..." if len(content) > 500 else content
 
         context_parts.append(f"## {title}")
         context_parts.append(content_preview)
@@ -291,37 +376,40 @@ def extract_experience_from_conversation(
     """
     experiences = []
 
-    # 提取成功案例
-    for i, msg in enumerate(messages):
+    # 滚动上下文窗口：当前消息加最多3条前文，避免每次命中都重新切片拼接
+    context_window = deque(maxlen=4)
+
+    for msg in messages:
         content = msg.get("content", "")
-        role = msg.get("role", "")
+        context_window.append(content)
 
-        # 检查成功模式
-        if role == "assistant" and ("成功" in content or "完成" in content):
-            # 提取上下文
-            context_messages = messages[max(0, i - 2) : i + 1]
-            context_text = "\n".join([m.get("content", "") for m in context_messages])
+        if msg.get("role", "") != "assistant":
+            continue
 
+        is_success = _SUCCESS_RE.search(content) is not None
+        is_failure = _FAILURE_RE.search(content) is not None
+
+        if not (is_success or is_failure):
+            continue
+
+        # 检查成功模式（当前消息加2条前文）
+        if is_success:
             experiences.append(
                 {
                     "type": "success_case",
                     "title": f"成功解决: {content[:50]}",
-                    "content": context_text,
+                    "content": "\n".join(list(context_window)[-3:]),
                     "tags": ["success", user_id, conv_id],
                 }
             )
 
-        # 检查错误模式
-        if role == "assistant" and ("错误" in content or "失败" in content):
-            # 提取错误和解决方案
-            context_messages = messages[max(0, i - 3) : i + 1]
-            context_text = "\n".join([m.get("content", "") for m in context_messages])
-
+        # 检查错误模式（当前消息加3条前文）
+        if is_failure:
             experiences.append(
                 {
                     "type": "failure_lesson",
                     "title": f"错误教训: {content[:50]}",
-                    "content": context_text,
+                    "content": "\n".join(context_window),
                     "tags": ["failure", user_id, conv_id],
                 }
             )
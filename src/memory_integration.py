@@ -6,6 +6,7 @@
 
 import os
 import logging
+import time
 from typing import Optional, List, Dict, Any
 from memory_client import (
     MemorySystemClient,
@@ -21,9 +22,14 @@ logger = logging.getLogger(__name__)
 class MemoryIntegration:
     """记忆系统集成器"""
 
+    # 统计信息客户端缓存时长（秒），避免机器人频繁轮询记忆服务
+    STATS_CACHE_TTL = 5.0
+
     def __init__(self):
         self.memory_client = get_memory_client()
         self.enabled = True
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
 
     def check_system_status(self) -> Dict[str, Any]:
         """检查记忆系统状态"""
@@ -104,34 +110,45 @@ class MemoryIntegration:
         logger.info(f"Extracting experiences from conversation: {conv_id}")
 
         experiences = extract_experience_from_conversation(messages, user_id, conv_id)
-        saved_count = 0
-
-        for exp in experiences:
-            try:
-                result = self.memory_client.create_memory(
-                    title=exp["title"],
-                    content=exp["content"],
-                    category=exp["type"],
-                    tags=exp["tags"],
-                )
-
-                if result:
-                    saved_count += 1
-                    logger.info(f"Saved experience: {result.get('id')}")
+        if not experiences:
+            return 0
 
-            except Exception as e:
-                logger.error(f"Failed to save experience: {e}")
+        items = [
+            {
+                "title": exp["title"],
+                "content": exp["content"],
+                "category": exp["type"],
+                "tags": exp["tags"],
+            }
+            for exp in experiences
+        ]
+
+        try:
+            results = self.memory_client.create_memories_bulk(items)
+            saved_count = sum(1 for r in results if r)
+        except Exception as e:
+            logger.error(f"Failed to save experiences: {e}")
+            saved_count = 0
 
         logger.info(f"Saved {saved_count}/{len(experiences)} experiences")
         return saved_count
 
     def get_memory_statistics(self) -> Dict[str, Any]:
-        """获取记忆统计信息"""
+        """获取记忆统计信息（带短TTL缓存）"""
         if not self.enabled:
             return {"enabled": False}
 
+        now = time.monotonic()
+        if (
+            self._stats_cache is not None
+            and now - self._stats_cached_at < self.STATS_CACHE_TTL
+        ):
+            return self._stats_cache
+
         stats = self.memory_client.get_statistics()
         stats["enabled"] = True
+        self._stats_cache = stats
+        self._stats_cached_at = now
         return stats
 
     def manual_query_memory(
@@ -166,17 +183,53 @@ def get_memory_integration() -> MemoryIntegration:
     return _memory_integration
 
 
+def _run_query(integration: MemoryIntegration, args: List[str]):
+    return integration.manual_query_memory(args[0] if args else "")
+
+
+def _run_stats(integration: MemoryIntegration, args: List[str]):
+    return integration.get_memory_statistics()
+
+
+def _run_status(integration: MemoryIntegration, args: List[str]):
+    return integration.check_system_status()
+
+
+def _fmt_query(memories: List[Dict[str, Any]]) -> str:
+    if not memories:
+        return "未找到相关记忆"
+
+    response = f"找到 {len(memories)} 条相关记忆：\n\n"
+    for i, mem in enumerate(memories[:5], 1):
+        title = mem.get("title", "No title")[:50]
+        response += f"{i}. {title}\n"
+    return response
+
+
+def _fmt_stats(stats: Dict[str, Any]) -> str:
+    total = stats.get("total", 0)
+    by_type = stats.get("by_type", {})
+
+    return f"""记忆系统统计：
+- 总记忆数: {total}
+- 长期记忆: {by_type.get("long_term", 0)}
+- 成功案例: {by_type.get("success_case", 0)}
+- 短期记忆: {by_type.get("short_term", 0)}
+- 上下文: {by_type.get("context", 0)}"""
+
+
+def _fmt_status(status: Dict[str, Any]) -> str:
+    return f"记忆系统状态: {'✅ 正常' if status.get('available') else '❌ 不可用'}"
+
+
+# 每个命令别名直接映射到 (执行函数, 响应格式化函数)，单次查表完成分发
 MEMORY_COMMANDS = {
-    "记忆查询": lambda integration, args: integration.manual_query_memory(
-        args[0] if args else ""
-    ),
-    "记忆统计": lambda integration, args: integration.get_memory_statistics(),
-    "记忆状态": lambda integration, args: integration.check_system_status(),
-    "memory query": lambda integration, args: integration.manual_query_memory(
-        args[0] if args else ""
-    ),
-    "memory stats": lambda integration, args: integration.get_memory_statistics(),
-    "memory status": lambda integration, args: integration.check_system_status(),
+    "记忆查询": (_run_query, _fmt_query),
+    "记忆统计": (_run_stats, _fmt_stats),
+    "记忆状态": (_run_status, _fmt_status),
+    "memory query": (_run_query, _fmt_query),
+    "memory stats": (_run_stats, _fmt_stats),
+    "memory status": (_run_status, _fmt_status),
 }
 
 
@@ -191,44 +244,15 @@ def handle_memory_command(command: str, args: List[str]) -> Optional[str]:
     Returns:
         命令响应文本
     """
-    integration = get_memory_integration()
-
-    if command not in MEMORY_COMMANDS:
+    entry = MEMORY_COMMANDS.get(command)
+    if entry is None:
         return None
 
-    try:
-        result = MEMORY_COMMANDS[command](integration, args)
-
-        if command in ["记忆查询", "memory query"]:
-            memories = result
-            if not memories:
-                return "未找到相关记忆"
-
-            response = f"找到 {len(memories)} 条相关记忆：\n\n"
-            for i, mem in enumerate(memories[:5], 1):
-                title = mem.get("title", "No title")[:50]
-                response += f"{i}. {title}\n"
-            return response
-
-        elif command in ["记忆统计", "memory stats"]:
-            stats = result
-            total = stats.get("total", 0)
-            by_type = stats.get("by_type", {})
-
-            return f"""记忆系统统计：
-- 总记忆数: {total}
-- 长期记忆: {by_type.get("long_term", 0)}
-- 成功案例: {by_type.get("success_case", 0)}
-- 短期记忆: {by_type.get("short_term", 0)}
-- 上下文: {by_type.get("context", 0)}"""
-
-        elif command in ["记忆状态", "memory status"]:
-            return (
-                f"记忆系统状态: {'✅ 正常' if result.get('available') else '❌ 不可用'}"
-            )
+    run, fmt = entry
+    integration = get_memory_integration()
 
+    try:
+        return fmt(run(integration, args))
     except Exception as e:
         logger.error(f"Handle memory command failed: {e}")
         return f"记忆系统命令执行失败: {e}"
-
-    return None
@@ -2,13 +2,67 @@
 Query Engine implementation
 """
 
+import functools
+import json
 import sqlite3
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Generation counter for the read caches below. Write paths bump it so
+# cached aggregates keyed on the old generation miss naturally.
+_stats_gen = 0
+
+
+def bump_stats_generation():
+    """Invalidate cached statistics/recent reads after a memory write."""
+    global _stats_gen
+    _stats_gen += 1
+
+
+def ttl_cache(ttl: float):
+    """
+    Cache method results for `ttl` seconds.
+
+    Keys on the engine's db_path (instances are created per request) plus
+    the call arguments and the current stats generation.
+    """
+
+    def decorator(func):
+        cache: Dict[Any, Any] = {}
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (self.db_path, args, tuple(sorted(kwargs.items())), _stats_gen)
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+
+            result = func(self, *args, **kwargs)
+
+            if len(cache) > 128:
+                for stale in [
+                    k for k, (ts, _) in cache.items() if now - ts >= ttl
+                ]:
+                    del cache[stale]
+            cache[key] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 class QueryEngine:
     """
@@ -31,8 +85,91 @@ class QueryEngine:
             db_path = os.path.abspath(db_path)
 
         self.db_path = db_path
+
+        # One stable SQL text per search type. Optional filters use NULL
+        # sentinels (? IS NULL OR col = ?) instead of string-appended clauses,
+        # so SQLite's per-connection statement cache can reuse the compiled
+        # plan across calls with different filter shapes.
+        # LIKE runs against the lowercase shadow columns (see db_init) with a
+        # pre-lowered pattern, making the match case-insensitive for CJK and
+        # non-ASCII text too. Columns are listed explicitly so the shadow
+        # columns stay out of the result dicts.
+        self._keyword_sql = f"""
+            SELECT {self._RESULT_COLUMNS} FROM memories
+            WHERE (? IS NULL OR type = ?)
+              AND (? IS NULL OR source = ?)
+              AND (title_lc LIKE ? OR content_lc LIKE ? OR tags LIKE ?)
+            ORDER BY score DESC, created_at DESC
+            LIMIT ?
+        """
+        self._hybrid_sql = f"""
+            SELECT {self._RESULT_COLUMNS} FROM memories
+            WHERE (? IS NULL OR type = ?)
+              AND (? IS NULL OR source = ?)
+              AND (title_lc LIKE ? OR content_lc LIKE ?)
+            ORDER BY score DESC, created_at DESC
+            LIMIT ?
+        """
+
+        # Keyword search goes through the FTS5 inverted index first (see
+        # db_init): MATCH walks posting lists instead of LIKE-scanning
+        # every content blob.
+        self._keyword_fts_sql = f"""
+            SELECT {self._RESULT_COLUMNS} FROM memories
+            WHERE (? IS NULL OR type = ?)
+              AND (? IS NULL OR source = ?)
+              AND id IN (SELECT rowid FROM memories_fts
+                         WHERE memories_fts MATCH ?)
+            ORDER BY score DESC, created_at DESC
+            LIMIT ?
+        """
+
+        # Databases created before db_init grew the shadow columns don't
+        # have them; the fallback texts lower at query time instead so
+        # search keeps working against a baseline schema.
+        self._keyword_sql_fallback = self._keyword_sql.replace(
+            "title_lc LIKE ? OR content_lc LIKE ?",
+            "LOWER(title) LIKE ? OR LOWER(content) LIKE ?",
+        )
+        self._hybrid_sql_fallback = self._hybrid_sql.replace(
+            "title_lc LIKE ? OR content_lc LIKE ?",
+            "LOWER(title) LIKE ? OR LOWER(content) LIKE ?",
+        )
+
         logger.info(f"QueryEngine initialized with db_path: {self.db_path}")
 
+    _RESULT_COLUMNS = (
+        "id, type, title, content, tags, source, "
+        "created_at, updated_at, expires_at, score"
+    )
+
+    # Read-tuning PRAGMAs for query connections. query_only enforces
+    # read-only at the driver level; read_uncommitted keeps readers from
+    # blocking behind the writer; mmap_size serves pages from the OS page
+    # cache instead of read() calls. The WAL journal-mode switch itself is a
+    # database property set by the writer/init path, not per reader.
+    _READ_PRAGMAS = (
+        "PRAGMA busy_timeout=2000",
+        "PRAGMA query_only=1",
+        "PRAGMA read_uncommitted=1",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    def _conn(self) -> sqlite3.Connection:
+        """Open a read-only, read-tuned connection to the memory database."""
+        try:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        except sqlite3.OperationalError:
+            # Database file may not exist yet; fall back to a normal open so
+            # callers get the usual "no such table" behavior instead of a
+            # connect error.
+            conn = sqlite3.connect(self.db_path)
+
+        for pragma in self._READ_PRAGMAS:
+            conn.execute(pragma)
+
+        return conn
+
     def search(
         self,
         query: str,
@@ -54,80 +191,88 @@ class QueryEngine:
         Returns:
             List of memory dicts
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
 
-        query_sql = "SELECT * FROM memories WHERE 1=1"
-        params = []
-
-        if memory_type:
-            query_sql += " AND type = ?"
-            params.append(memory_type)
-
-        if source:
-            query_sql += " AND source = ?"
-            params.append(source)
+        filter_params = [memory_type, memory_type, source, source]
 
         if search_type == "keyword":
-            results = self._search_keyword(cursor, query_sql, query, params, limit)
+            results = self._search_keyword(cursor, query, filter_params, limit)
         elif search_type == "semantic":
-            results = self._search_semantic(cursor, query_sql, query, params, limit)
+            results = self._search_semantic(cursor, query, filter_params, limit)
         else:
-            results = self._search_hybrid(cursor, query_sql, query, params, limit)
+            results = self._search_hybrid(cursor, query, filter_params, limit)
 
+        # Build result dicts straight from tuples; skips the per-row
+        # sqlite3.Row wrapper that dict() would immediately throw away.
+        columns = [d[0] for d in cursor.description]
         conn.close()
 
-        return [dict(row) for row in results]
+        return [dict(zip(columns, row)) for row in results]
 
     def _search_keyword(
         self,
         cursor: sqlite3.Cursor,
-        query_sql: str,
         query: str,
-        params: List,
+        filter_params: List,
         limit: int,
-    ) -> List[sqlite3.Row]:
+    ) -> List[tuple]:
         """Keyword search implementation."""
-        search_sql = query_sql + " AND (title LIKE ? OR content LIKE ? OR tags LIKE ?)"
-        search_params = params + [f"%{query}%", f"%{query}%", f"%{query}%"]
-
-        search_sql += " ORDER BY score DESC, created_at DESC LIMIT ?"
-        search_params.append(limit)
-
-        cursor.execute(search_sql, search_params)
+        # FTS fast path. The query is bound as one quoted prefix phrase so
+        # user input can't inject MATCH operators. Word-boundary semantics
+        # differ from a substring LIKE (and databases predating the FTS
+        # table raise), so no hits — or an error — falls through to the
+        # LIKE scan below.
+        match = '"{}"*'.format(query.replace('"', '""'))
+        try:
+            cursor.execute(
+                self._keyword_fts_sql, filter_params + [match, limit]
+            )
+            rows = cursor.fetchall()
+            if rows:
+                return rows
+        except sqlite3.OperationalError:
+            pass
+
+        like = f"%{query.lower()}%"
+        params = filter_params + [like, like, like, limit]
+        try:
+            cursor.execute(self._keyword_sql, params)
+        except sqlite3.OperationalError as e:
+            if "title_lc" not in str(e) and "content_lc" not in str(e):
+                raise
+            cursor.execute(self._keyword_sql_fallback, params)
         return cursor.fetchall()
 
     def _search_semantic(
         self,
         cursor: sqlite3.Cursor,
-        query_sql: str,
         query: str,
-        params: List,
+        filter_params: List,
         limit: int,
-    ) -> List[sqlite3.Row]:
+    ) -> List[tuple]:
         """Semantic search implementation (simplified for MVP without embeddings)."""
         logger.warning(
             "Semantic search not fully implemented without embeddings. Falling back to keyword search."
         )
-        return self._search_keyword(cursor, query_sql, query, params, limit)
+        return self._search_keyword(cursor, query, filter_params, limit)
 
     def _search_hybrid(
         self,
         cursor: sqlite3.Cursor,
-        query_sql: str,
         query: str,
-        params: List,
+        filter_params: List,
         limit: int,
-    ) -> List[sqlite3.Row]:
+    ) -> List[tuple]:
         """Hybrid search combining keyword and scoring."""
-        search_sql = query_sql + " AND (title LIKE ? OR content LIKE ?)"
-        search_params = params + [f"%{query}%", f"%{query}%"]
-
-        search_sql += " ORDER BY score DESC, created_at DESC LIMIT ?"
-        search_params.append(limit)
-
-        cursor.execute(search_sql, search_params)
+        like = f"%{query.lower()}%"
+        params = filter_params + [like, like, limit]
+        try:
+            cursor.execute(self._hybrid_sql, params)
+        except sqlite3.OperationalError as e:
+            if "title_lc" not in str(e) and "content_lc" not in str(e):
+                raise
+            cursor.execute(self._hybrid_sql_fallback, params)
         return cursor.fetchall()
 
     def retrieve_context(self, query_id: int) -> Optional[Dict[str, Any]]:
@@ -140,16 +285,19 @@ class QueryEngine:
         Returns:
             Memory dict or None
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM memories WHERE id = ?", (query_id,))
+        cursor.execute(
+            f"SELECT {self._RESULT_COLUMNS} FROM memories WHERE id = ?",
+            (query_id,),
+        )
         row = cursor.fetchone()
+        columns = [d[0] for d in cursor.description]
 
         conn.close()
 
-        return dict(row) if row else None
+        return dict(zip(columns, row)) if row else None
 
     def rank_results(
         self,
@@ -171,11 +319,8 @@ class QueryEngine:
         for result in results:
             score = result.get("score", 0.0)
 
-            title = result.get("title", "").lower()
-            content = result.get("content", "").lower()
-
-            title_match = query_lower in title
-            content_match = query_lower in content
+            title_match = query_lower in result.get("title", "").lower()
+            content_match = query_lower in result.get("content", "").lower()
 
             if title_match:
                 score += 0.3
@@ -203,35 +348,30 @@ class QueryEngine:
         Returns:
             List of related memory dicts
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
-        reference_memory = cursor.fetchone()
-
-        if not reference_memory:
-            conn.close()
-            return []
-
-        ref_type = reference_memory["type"]
-        ref_tags = dict(reference_memory).get("tags", "")
-
+        # Single statement: resolve the reference type via a subquery instead
+        # of materializing the full reference row (content can be KB-sized).
+        # A missing reference id yields a NULL type, which matches no rows.
         cursor.execute(
-            """
-            SELECT * FROM memories
-            WHERE id != ? AND type = ?
+            f"""
+            SELECT {self._RESULT_COLUMNS} FROM memories
+            WHERE type = (SELECT type FROM memories WHERE id = ?)
+              AND id != ?
             ORDER BY score DESC, created_at DESC
             LIMIT ?
             """,
-            (memory_id, ref_type, limit),
+            (memory_id, memory_id, limit),
         )
 
         results = cursor.fetchall()
+        columns = [d[0] for d in cursor.description]
         conn.close()
 
-        return [dict(row) for row in results]
+        return [dict(zip(columns, row)) for row in results]
 
+    @ttl_cache(ttl=10.0)
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get overall statistics.
@@ -239,21 +379,28 @@ class QueryEngine:
         Returns:
             Statistics dict
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) as count FROM memories")
-        total = cursor.fetchone()["count"]
-
-        cursor.execute("SELECT type, COUNT(*) as count FROM memories GROUP BY type")
-        type_counts = {row["type"]: row["count"] for row in cursor.fetchall()}
-
-        cursor.execute("SELECT source, COUNT(*) as count FROM memories GROUP BY source")
-        source_counts = {row["source"]: row["count"] for row in cursor.fetchall()}
+        # One round trip, one row: the grouped counts come back as JSON1
+        # objects so Python decodes them in a single pass instead of
+        # materializing a row per distinct type/source.
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM memories),
+                (SELECT AVG(score) FROM memories),
+                (SELECT json_group_object(type, c)
+                 FROM (SELECT type, COUNT(*) c FROM memories GROUP BY type)),
+                (SELECT json_group_object(source, c)
+                 FROM (SELECT source, COUNT(*) c FROM memories GROUP BY source))
+            """
+        )
+        total, avg_score, by_type_json, by_source_json = cursor.fetchone()
 
-        cursor.execute("SELECT AVG(score) as avg_score FROM memories")
-        avg_score = cursor.fetchone()["avg_score"] or 0.0
+        avg_score = avg_score or 0.0
+        type_counts = _json_loads(by_type_json) if by_type_json else {}
+        source_counts = _json_loads(by_source_json) if by_source_json else {}
 
         stats = {
             "total_memories": total,
@@ -266,6 +413,7 @@ class QueryEngine:
 
         return stats
 
+    @ttl_cache(ttl=10.0)
     def get_recent_memories(
         self,
         memory_type: str = None,
@@ -281,11 +429,10 @@ class QueryEngine:
         Returns:
             List of recent memory dicts
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
 
-        query_sql = "SELECT * FROM memories"
+        query_sql = f"SELECT {self._RESULT_COLUMNS} FROM memories"
         params = []
 
         if memory_type:
@@ -297,6 +444,7 @@ class QueryEngine:
 
         cursor.execute(query_sql, params)
         results = cursor.fetchall()
+        columns = [d[0] for d in cursor.description]
         conn.close()
 
-        return [dict(row) for row in results]
+        return [dict(zip(columns, row)) for row in results]
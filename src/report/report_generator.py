@@ -2,20 +2,86 @@
 Report Generator implementation
 """
 
+import hashlib
+import json
+import os
 import sqlite3
 import logging
+import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Fixed SQL texts, hoisted so every call reuses the same string and SQLite's
+# statement cache keeps the compiled plans hot. The period queries are
+# served by idx_memories_created_type / idx_reports_created_at (created
+# in db_init's schema script); the planner picks them on its own, so the
+# texts carry no INDEXED BY pins — a pin turns a missing index into a
+# hard error instead of a slower plan.
+_SUMMARY_SQL = """
+    SELECT COUNT(*) as count,
+           SUM(CASE WHEN type = 'success_case' THEN 1 ELSE 0 END) as success_count,
+           SUM(CASE WHEN type = 'failure_lesson' THEN 1 ELSE 0 END) as failure_count
+    FROM memories
+    WHERE created_at >= ? AND created_at < ?
+"""
+
+_SUMMARY_DETAILS_SQL = """
+    SELECT type, COUNT(*) as count, AVG(score) as avg_score,
+           SUM(COUNT(*)) OVER () as total,
+           SUM(CASE WHEN type = 'success_case' THEN COUNT(*) ELSE 0 END)
+               OVER () as success_total,
+           SUM(CASE WHEN type = 'failure_lesson' THEN COUNT(*) ELSE 0 END)
+               OVER () as failure_total
+    FROM memories
+    WHERE created_at >= ? AND created_at < ?
+    GROUP BY type
+    ORDER BY count DESC
+"""
+
+_DETAILS_SQL_BASE = """
+    SELECT type, COUNT(*) as count, AVG(score) as avg_score
+    FROM memories
+    WHERE created_at >= ? AND created_at < ?
+"""
+_DETAILS_SQL_TAIL = " GROUP BY type ORDER BY count DESC"
+
+# One precompiled variant per filter shape instead of string-appending
+# optional clauses per call.
+_DETAILS_SQL = _DETAILS_SQL_BASE + _DETAILS_SQL_TAIL
+_DETAILS_SQL_AGENT = _DETAILS_SQL_BASE + " AND source = ?" + _DETAILS_SQL_TAIL
+_DETAILS_SQL_TYPE = _DETAILS_SQL_BASE + " AND type = ?" + _DETAILS_SQL_TAIL
+_DETAILS_SQL_BOTH = (
+    _DETAILS_SQL_BASE + " AND source = ? AND type = ?" + _DETAILS_SQL_TAIL
+)
+
+_RANGE_SQL = """
+    SELECT date(created_at) as day, type, COUNT(*) as count, AVG(score) as avg_score
+    FROM memories
+    WHERE created_at >= ? AND created_at < ?
+    GROUP BY day, type
+    ORDER BY day
+"""
+
+_RECENT_REPORTS_SQL = """
+    SELECT report_type as type, start_date, end_date, created_at as generated_at
+    FROM reports
+    WHERE created_at >= ?
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
 
 class ReportGenerator:
     """
     Generates daily, weekly, monthly, and custom reports.
     """
 
+    # Reports for closed periods never change; cache them this long.
+    REPORT_CACHE_TTL = timedelta(hours=6)
+
     def __init__(self, db_path: str = None):
         """
         Initialize report generator.
@@ -24,16 +90,108 @@ class ReportGenerator:
             db_path: Path to SQLite database.
         """
         if db_path is None:
-            import os
-
             db_path = os.path.join(
                 os.path.dirname(__file__), "..", "data", "memory_system.db"
             )
             db_path = os.path.abspath(db_path)
 
         self.db_path = db_path
+
+        # One persistent connection instead of an open/close per query;
+        # report generation may run from scheduler worker threads, so guard
+        # access with a lock.
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-64000",
+            "PRAGMA busy_timeout=2000",
+        ):
+            self._conn.execute(pragma)
+
+        self._ensure_indexes()
+
         logger.info(f"ReportGenerator initialized with db_path: {self.db_path}")
 
+    def _ensure_indexes(self):
+        """Best-effort creation of the report indexes and cache table.
+
+        db_init's schema script owns these; this covers databases
+        initialized before it did. Each statement gets its own try so a
+        missing table (fresh file, init not run yet) skips only that
+        statement instead of everything after it.
+        """
+        statements = (
+            "CREATE INDEX IF NOT EXISTS idx_memories_created_type "
+            "ON memories(created_at, type, source, score)",
+            # Serves the recent-reports ORDER BY created_at DESC too:
+            # SQLite walks an ascending index backwards.
+            "CREATE INDEX IF NOT EXISTS idx_reports_created_at "
+            "ON reports(created_at)",
+            "CREATE TABLE IF NOT EXISTS reports_cache ("
+            "key TEXT PRIMARY KEY, payload BLOB, created_at TEXT)",
+        )
+        with self._lock:
+            for statement in statements:
+                try:
+                    self._conn.execute(statement)
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"Could not ensure report index: {e}")
+            self._conn.commit()
+
+    @staticmethod
+    def _cache_key(
+        report_type: str,
+        start_date: str,
+        end_date: str,
+        criteria: Dict[str, Any] = None,
+    ) -> str:
+        criteria_hash = hashlib.md5(
+            json.dumps(criteria or {}, sort_keys=True).encode()
+        ).hexdigest()
+        return f"{report_type}|{start_date}|{end_date}|{criteria_hash}"
+
+    @staticmethod
+    def _is_closed_period(end_date: str) -> bool:
+        """A period is closed once its end date lies before today (UTC)."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        return end_date[:10] < today
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, created_at FROM reports_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+
+        if not row:
+            return None
+
+        cached_at = datetime.fromisoformat(row["created_at"])
+        if datetime.now(timezone.utc) - cached_at >= self.REPORT_CACHE_TTL:
+            return None
+
+        logger.info(f"Report cache hit: {key}")
+        return json.loads(row["payload"])
+
+    def _cache_put(self, key: str, report: Dict[str, Any]):
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO reports_cache (key, payload, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, json.dumps(report), datetime.now(timezone.utc).isoformat()),
+                )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Report cache write failed: {e}")
+
     def generate_daily_report(self, date: str = None) -> Dict[str, Any]:
         """
         Generate daily report.
@@ -50,6 +208,14 @@ class ReportGenerator:
         start_date = f"{date} 00:00:00"
         end_date = f"{date} 23:59:59"
 
+        cache_key = self._cache_key("daily", start_date, end_date)
+        if self._is_closed_period(end_date):
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        summary, details = self._get_period_summary_and_details(start_date, end_date)
+
         report = {
             "type": "daily",
             "date": date,
@@ -57,11 +223,14 @@ class ReportGenerator:
                 "start": start_date,
                 "end": end_date,
             },
-            "summary": self._get_period_summary(start_date, end_date),
-            "details": self._get_period_details(start_date, end_date),
+            "summary": summary,
+            "details": details,
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        if self._is_closed_period(end_date):
+            self._cache_put(cache_key, report)
+
         logger.info(f"Generated daily report for {date}")
         return report
 
@@ -82,17 +251,28 @@ class ReportGenerator:
             dt = datetime.now(timezone.utc)
             end_date = dt.strftime("%Y-%m-%d")
 
+        cache_key = self._cache_key("weekly", start_date, end_date)
+        if self._is_closed_period(end_date):
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        summary, details = self._get_period_summary_and_details(start_date, end_date)
+
         report = {
             "type": "weekly",
             "period": {
                 "start": start_date,
                 "end": end_date,
             },
-            "summary": self._get_period_summary(start_date, end_date),
-            "details": self._get_period_details(start_date, end_date),
+            "summary": summary,
+            "details": details,
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        if self._is_closed_period(end_date):
+            self._cache_put(cache_key, report)
+
         logger.info(f"Generated weekly report for {start_date} to {end_date}")
         return report
 
@@ -123,17 +303,28 @@ class ReportGenerator:
             start_date = f"{month}-01"
             end_date = f"{month}-31"
 
+        cache_key = self._cache_key("monthly", start_date, end_date)
+        if self._is_closed_period(end_date):
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        summary, details = self._get_period_summary_and_details(start_date, end_date)
+
         report = {
             "type": "monthly",
             "period": {
                 "start": start_date,
                 "end": end_date,
             },
-            "summary": self._get_period_summary(start_date, end_date),
-            "details": self._get_period_details(start_date, end_date),
+            "summary": summary,
+            "details": details,
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        if self._is_closed_period(end_date):
+            self._cache_put(cache_key, report)
+
         logger.info(f"Generated monthly report for {month}")
         return report
 
@@ -172,6 +363,16 @@ class ReportGenerator:
                 next_month = dt.month + 1
                 end_date = f"{dt.year}-{next_month:02d}-01"
 
+        cache_key = self._cache_key("custom", start_date, end_date, criteria)
+        if self._is_closed_period(end_date):
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        summary, details = self._get_period_summary_and_details(
+            start_date, end_date, criteria
+        )
+
         report = {
             "type": "custom",
             "criteria": criteria,
@@ -179,41 +380,130 @@ class ReportGenerator:
                 "start": start_date,
                 "end": end_date,
             },
-            "summary": self._get_period_summary(start_date, end_date),
-            "details": self._get_period_details(start_date, end_date, criteria),
+            "summary": summary,
+            "details": details,
             "generated_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        if self._is_closed_period(end_date):
+            self._cache_put(cache_key, report)
+
         logger.info(f"Generated custom report: {report_type} from {start_date}")
         return report
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def generate_reports_range(
+        self, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
         """
-        Get overall statistics for reports.
+        Generate daily reports for every day in [start_date, end_date].
+
+        One grouped query covers the whole range and is pivoted into per-day
+        reports, instead of running generate_daily_report (two range scans
+        each) once per day — a backfill of a year costs one sequential scan.
+
+        Args:
+            start_date: First day in YYYY-MM-DD format (inclusive)
+            end_date: Last day in YYYY-MM-DD format (inclusive)
 
         Returns:
-            Statistics dict
+            List of daily report dicts, one per day, in date order
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        range_end = (
+            datetime.fromisoformat(end_date) + timedelta(days=1)
+        ).strftime("%Y-%m-%d")
 
-        cursor.execute("SELECT COUNT(*) as count FROM memories")
-        total_memories = cursor.fetchone()["count"]
+        with self._lock:
+            rows = self._conn.execute(
+                _RANGE_SQL, (start_date, range_end)
+            ).fetchall()
+
+        per_day = defaultdict(list)
+        for row in rows:
+            per_day[row["day"]].append(row)
+
+        generated_at = datetime.now(timezone.utc).isoformat()
+        reports = []
+        day = datetime.fromisoformat(start_date)
+        last = datetime.fromisoformat(end_date)
+        while day <= last:
+            date = day.strftime("%Y-%m-%d")
+            day_rows = per_day.get(date, ())
+
+            total = sum(r["count"] for r in day_rows)
+            success = sum(
+                r["count"] for r in day_rows if r["type"] == "success_case"
+            )
+            failure = sum(
+                r["count"] for r in day_rows if r["type"] == "failure_lesson"
+            )
+
+            details = [
+                (row["type"], row["count"], row["avg_score"]) for row in day_rows
+            ]
+
+            reports.append(
+                {
+                    "type": "daily",
+                    "date": date,
+                    "period": {
+                        "start": f"{date} 00:00:00",
+                        "end": f"{date} 23:59:59",
+                    },
+                    "summary": {
+                        "total_memories": total,
+                        "success_cases": success,
+                        "failure_lessons": failure,
+                        "extraction_rate": round(success / total * 100, 2)
+                        if total > 0
+                        else 0,
+                    },
+                    "details": details,
+                    "generated_at": generated_at,
+                }
+            )
+            day += timedelta(days=1)
+
+        logger.info(
+            f"Generated {len(reports)} daily reports for {start_date} to {end_date}"
+        )
+        return reports
 
-        cursor.execute("SELECT type, COUNT(*) as count FROM memories GROUP BY type")
-        by_type = {row["type"]: row["count"] for row in cursor.fetchall()}
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get overall statistics for reports.
 
-        cursor.execute("SELECT source, COUNT(*) as count FROM memories GROUP BY source")
-        by_source = {row["source"]: row["count"] for row in cursor.fetchall()}
+        Returns:
+            Statistics dict
+        """
+        # One scan over memories instead of four: group by (type, source)
+        # and post-aggregate the small per-group rows in Python. The overall
+        # average is the count-weighted mean of the group averages.
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            cursor.execute(
+                "SELECT type, source, COUNT(*) as count, AVG(score) as avg_score "
+                "FROM memories GROUP BY type, source"
+            )
+            group_rows = cursor.fetchall()
 
-        cursor.execute("SELECT AVG(score) as avg_score FROM memories")
-        avg_score = cursor.fetchone()["avg_score"] or 0.0
+            cursor.execute(
+                "SELECT COUNT(DISTINCT agent_id) as count FROM config_history"
+            )
+            total_agents = cursor.fetchone()["count"]
 
-        cursor.execute("SELECT COUNT(DISTINCT agent_id) as count FROM config_history")
-        total_agents = cursor.fetchone()["count"]
+        total_memories = 0
+        score_sum = 0.0
+        by_type: Dict[str, int] = {}
+        by_source: Dict[str, int] = {}
+        for row in group_rows:
+            count = row["count"]
+            total_memories += count
+            score_sum += (row["avg_score"] or 0.0) * count
+            by_type[row["type"]] = by_type.get(row["type"], 0) + count
+            by_source[row["source"]] = by_source.get(row["source"], 0) + count
 
-        conn.close()
+        avg_score = score_sum / total_memories if total_memories else 0.0
 
         stats = {
             "total_memories": total_memories,
@@ -241,8 +531,6 @@ class ReportGenerator:
             output_dir = os.path.join(os.path.dirname(__file__), "..", "..", "reports")
             output_dir = os.path.abspath(output_dir)
 
-        import os
-
         os.makedirs(output_dir, exist_ok=True)
 
         report_type = report["type"]
@@ -250,59 +538,121 @@ class ReportGenerator:
         filename = f"{report_type}_{date_str}.md"
         file_path = os.path.join(output_dir, filename)
 
-        content = f"# {report_type.upper()} Report\n\n"
-        content += f"**Date**: {report.get('date', 'N/A')}\n\n"
+        # Collect fragments and join once; += on str copies the whole
+        # accumulated body per line.
+        parts = [f"# {report_type.upper()} Report\n\n"]
+        parts.append(f"**Date**: {report.get('date', 'N/A')}\n\n")
 
         period = report.get("period", {})
-        content += f"**Period**: {period.get('start', 'N/A')} to {period.get('end', 'N/A')}\n\n"
+        parts.append(
+            f"**Period**: {period.get('start', 'N/A')} to {period.get('end', 'N/A')}\n\n"
+        )
 
         summary = report.get("summary", {})
-        content += f"## Summary\n\n"
+        parts.append("## Summary\n\n")
 
         for key, value in summary.items():
-            content += f"- {key}: {value}\n"
-
-        content += "\n## Details\n\n"
-
-        details = report.get("details", [])
-
-        for category, items in details.items():
-            content += f"### {category}\n\n"
-            for item in items:
-                if isinstance(item, dict):
-                    content += (
-                        f"- {item.get('name', 'Unknown')}: {item.get('value', 'N/A')}\n"
-                    )
-                else:
-                    content += f"- {item}\n"
+            parts.append(f"- {key}: {value}\n")
+
+        parts.append("\n## Details\n\n")
+
+        details = report.get("details", ())
+
+        if isinstance(details, dict):
+            # Legacy shape: {category: [items]} from externally built
+            # reports. Items are usually name/value dicts but plain
+            # strings are valid too; one getattr per item dispatches
+            # without an isinstance scan.
+            for category, items in details.items():
+                parts.append(f"### {category}\n\n")
+                for item in items:
+                    get = getattr(item, "get", None)
+                    if get is not None:
+                        parts.append(
+                            f"- {get('name', 'Unknown')}: {get('value', 'N/A')}\n"
+                        )
+                    else:
+                        parts.append(f"- {item}\n")
+        else:
+            # (type, count, avg_score) records from the period queries;
+            # numbers are formatted only here, at write time.
+            for mem_type, count, avg_score in details:
+                parts.append(f"### {mem_type}\n\n")
+                parts.append(
+                    f"- {mem_type}: {count} memories (avg score: {avg_score:.2f})\n"
+                )
 
-        content += f"\n**Generated**: {report.get('generated_at', 'N/A')}\n"
+        parts.append(f"\n**Generated**: {report.get('generated_at', 'N/A')}\n")
 
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.write("".join(parts))
 
         logger.info(f"Saved report: {file_path}")
         return file_path
 
+    def _get_period_summary_and_details(
+        self, start_date: str, end_date: str, criteria: Dict[str, Any] = None
+    ) -> tuple:
+        """
+        Get period summary and details in one scan.
+
+        The grouped rows feed the details breakdown while window totals on
+        the same rows provide the summary, so the created_at range is walked
+        once instead of twice.
+
+        Args:
+            start_date: Period start (inclusive)
+            end_date: Period end (exclusive)
+            criteria: Optional filters; when present the summary must stay
+                unfiltered, so the legacy two-query path is used.
+
+        Returns:
+            (summary dict, details dict) tuple
+        """
+        if criteria and ("agent_id" in criteria or "memory_type" in criteria):
+            # Details are filtered but the summary covers the whole period;
+            # the shapes differ, so they cannot share one statement.
+            return (
+                self._get_period_summary(start_date, end_date),
+                self._get_period_details(start_date, end_date, criteria),
+            )
+
+        with self._lock:
+            rows = self._conn.execute(
+                _SUMMARY_DETAILS_SQL, (start_date, end_date)
+            ).fetchall()
+
+        if not rows:
+            return (
+                {
+                    "total_memories": 0,
+                    "success_cases": 0,
+                    "failure_lessons": 0,
+                    "extraction_rate": 0.0,
+                },
+                {},
+            )
+
+        first = rows[0]
+        summary = {
+            "total_memories": first["total"],
+            "success_cases": first["success_total"],
+            "failure_lessons": first["failure_total"],
+            "extraction_rate": round(first["success_total"] / first["total"] * 100, 2)
+            if first["total"] > 0
+            else 0,
+        }
+
+        details = [
+            (row["type"], row["count"], row["avg_score"]) for row in rows
+        ]
+
+        return summary, details
+
     def _get_period_summary(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Get period summary statistics."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) as count,
-                   SUM(CASE WHEN type = 'success_case' THEN 1 ELSE 0 END) as success_count,
-                   SUM(CASE WHEN type = 'failure_lesson' THEN 1 ELSE 0 END) as failure_count
-            FROM memories
-            WHERE created_at >= ? AND created_at < ?
-            """,
-            (start_date, end_date),
-        )
-
-        row = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            row = self._conn.execute(_SUMMARY_SQL, (start_date, end_date)).fetchone()
 
         if row:
             return {
@@ -323,49 +673,38 @@ class ReportGenerator:
 
     def _get_period_details(
         self, start_date: str, end_date: str, criteria: Dict[str, Any] = None
-    ) -> Dict[str, List[Any]]:
-        """Get detailed breakdown by category and agent."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        query_sql = """
-            SELECT type, COUNT(*) as count, AVG(score) as avg_score
-            FROM memories
-            WHERE created_at >= ? AND created_at < ?
+    ) -> List[tuple]:
         """
+        Get detailed breakdown by category and agent.
 
+        Returns (type, count, avg_score) records; formatting is deferred to
+        save_report so the numeric values stay usable downstream without
+        re-parsing strings.
+        """
+        # Pick the precompiled variant for this filter shape; parameters are
+        # always bound in (start, end, source?, type?) order.
         params = [start_date, end_date]
+        has_agent = bool(criteria and "agent_id" in criteria)
+        has_type = bool(criteria and "memory_type" in criteria)
 
-        if criteria and "agent_id" in criteria:
-            query_sql += " AND source = ?"
+        if has_agent:
             params.append(criteria["agent_id"])
-
-        if criteria and "memory_type" in criteria:
-            query_sql += " AND type = ?"
+        if has_type:
             params.append(criteria["memory_type"])
 
-        query_sql += " GROUP BY type ORDER BY count DESC"
-
-        cursor.execute(query_sql, params)
-        rows = cursor.fetchall()
-        conn.close()
+        if has_agent and has_type:
+            query_sql = _DETAILS_SQL_BOTH
+        elif has_agent:
+            query_sql = _DETAILS_SQL_AGENT
+        elif has_type:
+            query_sql = _DETAILS_SQL_TYPE
+        else:
+            query_sql = _DETAILS_SQL
 
-        details = {}
+        with self._lock:
+            rows = self._conn.execute(query_sql, params).fetchall()
 
-        for row in rows:
-            mem_type = row["type"]
-            if mem_type not in details:
-                details[mem_type] = []
-
-            details[mem_type].append(
-                {
-                    "name": mem_type,
-                    "value": f"{row['count']} memories (avg score: {row['avg_score']:.2f})",
-                }
-            )
-
-        return details
+        return [(row["type"], row["count"], row["avg_score"]) for row in rows]
 
     def get_recent_reports(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -377,22 +716,14 @@ class ReportGenerator:
         Returns:
             List of report summaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT report_type as type, start_date, end_date, created_at as generated_at
-            FROM reports
-            WHERE created_at >= ?
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            ((datetime.now(timezone.utc) - timedelta(days=7)).isoformat(), limit),
-        )
-
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = None  # positional tuples; dicts built once below
+            cursor.execute(
+                _RECENT_REPORTS_SQL,
+                ((datetime.now(timezone.utc) - timedelta(days=7)).isoformat(), limit),
+            )
+            cols = [d[0] for d in cursor.description]
+            rows = cursor.fetchall()
 
-        return [dict(row) for row in rows]
+        return [dict(zip(cols, row)) for row in rows]
@@ -2,10 +2,12 @@
 Task Scheduler implementation
 """
 
+import functools
+import queue
+import threading
 import time
 import logging
 from typing import Callable, Optional, Dict, Any
-from datetime import datetime, timezone
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -19,6 +21,36 @@ import json
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _build_trigger(schedule: str):
+    """
+    Build an APScheduler trigger from a schedule string.
+
+    Trigger instances are stateless and reusable, so identical schedule
+    strings (common when many tasks share e.g. "0 23 * * *") are memoized
+    instead of re-parsing the cron fields per task. Raises on malformed
+    schedules so failures are not cached; callers log and translate to None.
+    """
+    parts = schedule.split()
+    if len(parts) == 5:
+        return CronTrigger(
+            minute=parts[0],
+            hour=parts[1],
+            day=parts[2],
+            month=parts[3],
+            day_of_week=parts[4],
+        )
+    if schedule.startswith("interval "):
+        return IntervalTrigger(seconds=int(parts[1]))
+    return None
+
+
+def _utc_now_iso() -> str:
+    """ISO-8601 UTC timestamp; time.strftime avoids the datetime object
+    construction and isoformat() cost on every task-state write."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
 class TaskScheduler:
     """
     Task scheduler with cron-like scheduling, priority management, and retry mechanism.
@@ -27,6 +59,10 @@ class TaskScheduler:
     TASK_PRIORITIES = ["low", "normal", "high", "critical"]
     TASK_STATUSES = ["pending", "running", "completed", "failed", "cancelled"]
 
+    # How long a freshly added task row may be trusted from the in-memory
+    # cache before trigger_task re-reads the database.
+    TASK_CACHE_TTL = 1.0
+
     def __init__(self, db_path: str = None):
         """
         Initialize task scheduler.
@@ -51,12 +87,27 @@ class TaskScheduler:
             jobstores=jobstores, executors=executors, job_defaults=job_defaults
         )
         self.task_functions: Dict[str, Callable] = {}
+
+        # task_logs inserts are drained by a dedicated writer thread so
+        # scheduler workers are not serialized on the DB write lock.
+        self._log_queue: queue.Queue = queue.Queue()
+        self._log_thread: Optional[threading.Thread] = None
+
+        # Hot cache of freshly added task rows so a burst of manual
+        # triggers does not re-read each row it just wrote. Entries are
+        # (task_type, status, retry_count, max_retries, cached_at).
+        self._task_cache: Dict[int, tuple] = {}
+
         logger.info("TaskScheduler initialized")
 
     def _init_db(self):
         """Initialize database connection and tables if needed."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         conn = sqlite3.connect(self.db_path)
+        # WAL keeps readers unblocked during task writes; synchronous=NORMAL
+        # drops the per-commit fsync to one per WAL checkpoint.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS tasks (
@@ -127,7 +178,7 @@ class TaskScheduler:
         if priority not in self.TASK_PRIORITIES:
             raise ValueError(f"Invalid priority: {priority}")
 
-        now = datetime.now(timezone.utc).isoformat()
+        now = _utc_now_iso()
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -136,13 +187,27 @@ class TaskScheduler:
             INSERT INTO tasks (task_type, priority, schedule, retry_count, max_retries,
                                status, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, 'pending', ?, ?)
+            RETURNING id
             """,
             (task_type, priority, schedule, retry_count, max_retries, now, now),
         )
-        task_id = cursor.lastrowid
+        task_id = cursor.fetchone()[0]
         conn.commit()
         conn.close()
 
+        # Only manual-trigger tasks are cached — they are the ones a
+        # trigger_task call follows moments later. Scheduled tasks would
+        # sit in the dict forever (nothing pops them), leaking over a
+        # long-running scheduler's lifetime.
+        if manual_trigger:
+            self._task_cache[task_id] = (
+                task_type,
+                "pending",
+                retry_count,
+                max_retries,
+                time.monotonic(),
+            )
+
         logger.info(f"Added task {task_id}: {task_type} (priority={priority})")
 
         if schedule and not manual_trigger:
@@ -150,6 +215,66 @@ class TaskScheduler:
 
         return task_id
 
+    def bulk_add_tasks(self, tasks: list) -> list:
+        """
+        Add many tasks in one transaction.
+
+        Args:
+            tasks: List of task dicts with the same keys as add_task
+                   arguments (task_type required, the rest optional).
+
+        Returns:
+            List of created task IDs
+        """
+        if not tasks:
+            return []
+
+        for task in tasks:
+            priority = task.get("priority", "normal")
+            if priority not in self.TASK_PRIORITIES:
+                raise ValueError(f"Invalid priority: {priority}")
+
+        now = _utc_now_iso()
+        rows = [
+            (
+                task["task_type"],
+                task.get("priority", "normal"),
+                task.get("schedule"),
+                task.get("retry_count", 3),
+                task.get("max_retries", 3),
+                now,
+                now,
+            )
+            for task in tasks
+        ]
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        with conn:
+            # executemany in chunks inside one transaction: one fsync for
+            # the whole batch instead of one per task.
+            for start in range(0, len(rows), 500):
+                cursor.executemany(
+                    """
+                    INSERT INTO tasks (task_type, priority, schedule, retry_count,
+                                       max_retries, status, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, 'pending', ?, ?)
+                    """,
+                    rows[start : start + 500],
+                )
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        conn.close()
+
+        # Single transaction, single writer: ids are contiguous.
+        task_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+
+        for task_id, task in zip(task_ids, tasks):
+            if task.get("schedule") and not task.get("manual_trigger", False):
+                self._schedule_task(task_id, task["task_type"], task["schedule"])
+
+        logger.info(f"Added {len(task_ids)} tasks in bulk")
+        return task_ids
+
     def _schedule_task(self, task_id: int, task_type: str, schedule: str):
         """
         Schedule a task using APScheduler.
@@ -188,40 +313,33 @@ class TaskScheduler:
         Returns:
             APScheduler Trigger object or None
         """
-        parts = schedule.split()
-        if len(parts) == 5:
-            try:
-                return CronTrigger(
-                    minute=parts[0],
-                    hour=parts[1],
-                    day=parts[2],
-                    month=parts[3],
-                    day_of_week=parts[4],
-                )
-            except Exception as e:
-                logger.error(f"Failed to parse cron schedule: {e}")
-                return None
-        elif schedule.startswith("interval "):
-            try:
-                interval = int(schedule.split()[1])
-                return IntervalTrigger(seconds=interval)
-            except Exception as e:
-                logger.error(f"Failed to parse interval schedule: {e}")
-                return None
-        return None
+        try:
+            return _build_trigger(schedule)
+        except Exception as e:
+            logger.error(f"Failed to parse schedule '{schedule}': {e}")
+            return None
 
-    def _execute_task(self, task_id: int, task_type: str):
+    def _execute_task(
+        self,
+        task_id: int,
+        task_type: str,
+        retry_count: int = None,
+        max_retries: int = None,
+    ):
         """
         Execute a task with retry logic.
 
         Args:
             task_id: Database task ID
             task_type: Type of task to execute
+            retry_count: Pre-fetched retry count; looked up when None
+            max_retries: Pre-fetched retry limit; looked up when None
         """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        started_at = datetime.now(timezone.utc).isoformat()
+        started_at = _utc_now_iso()
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute(
             """
             UPDATE tasks SET status='running', last_run_at=?, updated_at=?
@@ -230,11 +348,15 @@ class TaskScheduler:
             (started_at, started_at, task_id),
         )
 
-        cursor.execute(
-            "SELECT retry_count, max_retries FROM tasks WHERE id=?", (task_id,)
-        )
-        task_data = cursor.fetchone()
-        retry_count, max_retries = task_data[0], task_data[1]
+        # Callers that already read the task row (trigger_task) pass the
+        # retry bookkeeping through instead of re-querying it here.
+        if retry_count is None or max_retries is None:
+            cursor.execute(
+                "SELECT retry_count, max_retries FROM tasks WHERE id=?", (task_id,)
+            )
+            task_data = cursor.fetchone()
+            retry_count, max_retries = task_data[0], task_data[1]
+        conn.commit()
 
         success = False
         error_message = None
@@ -252,9 +374,13 @@ class TaskScheduler:
             error_message = str(e)
             logger.error(f"Task {task_id} failed: {error_message}")
 
-        completed_at = datetime.now(timezone.utc).isoformat()
+        completed_at = _utc_now_iso()
         status = "completed" if success else "failed"
 
+        # Status update, retry bookkeeping, and log insert share one
+        # transaction: a single fsync instead of one per statement.
+        cursor.execute("BEGIN IMMEDIATE")
+
         if not success and retry_count < max_retries:
             retry_count += 1
             status = "pending"
@@ -271,23 +397,66 @@ class TaskScheduler:
                 (status, completed_at, task_id),
             )
 
-        cursor.execute(
-            """
-            INSERT INTO task_logs (task_id, status, started_at, completed_at, error_message)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+        conn.commit()
+        conn.close()
+
+        self._enqueue_log(
             (
                 task_id,
                 "completed" if success else "failed",
                 started_at,
                 completed_at,
                 error_message,
-            ),
+            )
         )
 
-        conn.commit()
+    def _enqueue_log(self, record: tuple):
+        """Hand a task_logs row to the writer thread, or write it inline
+        when the scheduler (and with it the writer) is not running."""
+        if self._log_thread is not None and self._log_thread.is_alive():
+            self._log_queue.put(record)
+        else:
+            self._write_logs([record])
+
+    def _write_logs(self, batch: list):
+        """Insert a batch of task_logs rows in one transaction."""
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO task_logs (task_id, status, started_at, completed_at, error_message)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                batch,
+            )
         conn.close()
 
+    def _log_writer(self):
+        """Drain the log queue, batching up to 500 rows per transaction.
+        A None record is the shutdown sentinel; pending rows are flushed
+        before the thread exits."""
+        stopping = False
+        while not stopping:
+            record = self._log_queue.get()
+            if record is None:
+                return
+
+            batch = [record]
+            while len(batch) < 500:
+                try:
+                    next_record = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_record is None:
+                    stopping = True
+                    break
+                batch.append(next_record)
+
+            try:
+                self._write_logs(batch)
+            except Exception as e:
+                logger.error(f"Task log write failed: {e}")
+
     def trigger_task(self, task_id: int) -> bool:
         """
         Manually trigger a task.
@@ -298,22 +467,32 @@ class TaskScheduler:
         Returns:
             True if task was triggered, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT task_type, status FROM tasks WHERE id=?", (task_id,))
-        task_data = cursor.fetchone()
-        conn.close()
+        # Fast path: a task added moments ago is still exactly as written.
+        # The entry is popped because execution mutates status/retries, so
+        # a second trigger must go back to the database.
+        cached = self._task_cache.pop(task_id, None)
+        if cached is not None and time.monotonic() - cached[4] < self.TASK_CACHE_TTL:
+            task_type, status, retry_count, max_retries = cached[:4]
+        else:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT task_type, status, retry_count, max_retries FROM tasks WHERE id=?",
+                (task_id,),
+            )
+            task_data = cursor.fetchone()
+            conn.close()
 
-        if not task_data:
-            logger.warning(f"Task {task_id} not found")
-            return False
+            if not task_data:
+                logger.warning(f"Task {task_id} not found")
+                return False
 
-        task_type, status = task_data[0], task_data[1]
+            task_type, status, retry_count, max_retries = task_data
         if status in ["cancelled", "completed"]:
             logger.warning(f"Task {task_id} is {status}, cannot trigger")
             return False
 
-        self._execute_task(task_id, task_type)
+        self._execute_task(task_id, task_type, retry_count, max_retries)
         return True
 
     def cancel_task(self, task_id: int) -> bool:
@@ -326,6 +505,8 @@ class TaskScheduler:
         Returns:
             True if task was cancelled, False otherwise
         """
+        self._task_cache.pop(task_id, None)
+
         job_id = f"task_{task_id}"
         try:
             self.scheduler.remove_job(job_id)
@@ -334,9 +515,12 @@ class TaskScheduler:
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        # Guarding on status makes re-cancelling a no-op write (no page
+        # dirtied, nothing to fsync) instead of a redundant update.
         cursor.execute(
-            "UPDATE tasks SET status='cancelled', updated_at=? WHERE id=?",
-            (datetime.now(timezone.utc).isoformat(), task_id),
+            "UPDATE tasks SET status='cancelled', updated_at=? "
+            "WHERE id=? AND status != 'cancelled'",
+            (_utc_now_iso(), task_id),
         )
         conn.commit()
         conn.close()
@@ -355,14 +539,14 @@ class TaskScheduler:
             Task status dict or None if not found
         """
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
         task = cursor.fetchone()
+        cols = [d[0] for d in cursor.description]
         conn.close()
 
         if task:
-            return dict(task)
+            return dict(zip(cols, task))
         return None
 
     def get_all_tasks(self, status: str = None) -> list:
@@ -376,7 +560,6 @@ class TaskScheduler:
             List of task dicts
         """
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         if status:
@@ -384,13 +567,18 @@ class TaskScheduler:
         else:
             cursor.execute("SELECT * FROM tasks ORDER BY id")
 
-        tasks = [dict(row) for row in cursor.fetchall()]
+        # Column names computed once, rows stay positional tuples; avoids a
+        # sqlite3.Row wrapper plus dict conversion per row.
+        cols = [d[0] for d in cursor.description]
+        tasks = [dict(zip(cols, row)) for row in cursor.fetchall()]
         conn.close()
         return tasks
 
     def start(self):
         """Start the scheduler."""
         self.scheduler.start()
+        self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        self._log_thread.start()
         logger.info("TaskScheduler started")
 
     def shutdown(self):
@@ -399,4 +587,10 @@ class TaskScheduler:
             self.scheduler.shutdown()
         except:
             pass
+
+        if self._log_thread is not None and self._log_thread.is_alive():
+            self._log_queue.put(None)
+            self._log_thread.join(timeout=5)
+            self._log_thread = None
+
         logger.info("TaskScheduler shutdown")
@@ -3,9 +3,203 @@ Database initialization script for Intelligent Memory System
 Creates SQLite database with required tables: memories, config_history, agent_metrics
 """
 
+import atexit
+import logging
 import sqlite3
 import os
-from datetime import datetime
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Bump when _SCHEMA_SQL changes so existing databases re-run the DDL.
+SCHEMA_VERSION = 9
+
+# Default database location, resolved once at import instead of a
+# join/abspath (and its getcwd call) per connection request.
+_DEFAULT_DB_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "memory_system.db")
+)
+
+
+def now_epoch() -> int:
+    """Current time as unix-epoch seconds, for integer timestamp columns."""
+    return int(time.time())
+
+# Canonical safe-under-WAL connection settings. journal_mode=WAL is a
+# database property; the others must be re-applied on every connection.
+# page_size is sticky after the first write, so it must come before the
+# WAL switch — it only takes effect on freshly created files. mmap_size
+# is a cap, not an allocation: SQLite maps at most the file's size, and
+# mapped reads skip the pread syscall per page touch.
+_CONNECTION_PRAGMAS = """
+    PRAGMA page_size=8192;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=1073741824;
+    PRAGMA cache_size=-65536;
+    PRAGMA busy_timeout=5000;
+    PRAGMA wal_autocheckpoint=10000;
+"""
+
+# Full schema as one script, bracketed by an explicit BEGIN/COMMIT:
+# executescript does no transaction management of its own, so without
+# the bracket each DDL statement would autocommit (and flush)
+# individually, and a mid-script failure would leave a half-built
+# schema behind. One script also means one pass through the driver
+# instead of a round-trip per CREATE statement.
+_SCHEMA_SQL = """
+    BEGIN;
+
+    CREATE TABLE IF NOT EXISTS memories (
+        id INTEGER PRIMARY KEY,
+        type TEXT NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        tags TEXT,
+        source TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        expires_at TEXT,
+        score REAL DEFAULT 0.0,
+        title_lc TEXT GENERATED ALWAYS AS (LOWER(title)) VIRTUAL,
+        content_lc TEXT GENERATED ALWAYS AS (LOWER(content)) VIRTUAL,
+        created_epoch INTEGER GENERATED ALWAYS
+            AS (CAST(strftime('%s', created_at) AS INTEGER)) VIRTUAL
+    );
+
+    -- STRICT: all values arrive already typed, so writes skip the
+    -- per-value affinity coercion. These tables keep their rowid id —
+    -- config_manager updates/deletes by id, and WITHOUT ROWID would also
+    -- drop the id auto-assignment writers rely on.
+    CREATE TABLE IF NOT EXISTS config_history (
+        id INTEGER PRIMARY KEY,
+        agent_id TEXT NOT NULL,
+        config_data TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    ) STRICT;
+
+    CREATE TABLE IF NOT EXISTS agent_metrics (
+        id INTEGER PRIMARY KEY,
+        agent_id TEXT NOT NULL,
+        accuracy REAL DEFAULT 0.0,
+        response_time REAL DEFAULT 0.0,
+        tasks_completed INTEGER DEFAULT 0,
+        timestamp TEXT NOT NULL
+    ) STRICT;
+
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY,
+        task_type TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        schedule TEXT,
+        retry_count INTEGER DEFAULT 3,
+        max_retries INTEGER DEFAULT 3,
+        status TEXT NOT NULL,
+        last_run_at TEXT,
+        next_run_at TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS task_logs (
+        id INTEGER PRIMARY KEY,
+        task_id INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        started_at TEXT NOT NULL,
+        completed_at TEXT,
+        error_message TEXT,
+        FOREIGN KEY (task_id) REFERENCES tasks(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS reports (
+        id INTEGER PRIMARY KEY,
+        report_type TEXT NOT NULL,
+        start_date TEXT,
+        end_date TEXT,
+        content TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    );
+
+    -- No index on title_lc: the search patterns are %-prefixed, which a
+    -- B-tree can never serve, so the index only taxed writes.
+    DROP INDEX IF EXISTS idx_memories_title_lc;
+    CREATE INDEX IF NOT EXISTS idx_memories_source ON memories(source);
+    CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at);
+    -- created_epoch stays available for integer-epoch consumers, but no
+    -- query binds it yet, so it carries no index — that would be paid on
+    -- every insert for zero reads.
+    DROP INDEX IF EXISTS idx_memories_created_epoch;
+    CREATE INDEX IF NOT EXISTS idx_tasks_next_run_at ON tasks(next_run_at);
+    CREATE INDEX IF NOT EXISTS idx_task_logs_task_id ON task_logs(task_id);
+    CREATE INDEX IF NOT EXISTS idx_reports_type ON reports(report_type);
+    CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports(created_at);
+
+    -- Composite indexes match the hot "rows of type/status X, newest or
+    -- next-due first" predicates and return rows pre-sorted; their leftmost
+    -- column also covers the single-column lookups, so the old
+    -- single-column indexes are dropped as redundant.
+    CREATE INDEX IF NOT EXISTS idx_memories_type_created
+        ON memories(type, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_tasks_status_next_run
+        ON tasks(status, next_run_at);
+    DROP INDEX IF EXISTS idx_memories_type;
+    DROP INDEX IF EXISTS idx_tasks_status;
+
+    -- Report-side objects: the covering index for the period aggregates
+    -- and the closed-period report cache. No DESC twin of
+    -- idx_reports_created_at — SQLite walks the ascending index backwards
+    -- for ORDER BY created_at DESC, so a second index would only double
+    -- the maintenance cost per report insert.
+    CREATE INDEX IF NOT EXISTS idx_memories_created_type
+        ON memories(created_at, type, source, score);
+    DROP INDEX IF EXISTS idx_reports_created;
+    CREATE TABLE IF NOT EXISTS reports_cache (
+        key TEXT PRIMARY KEY,
+        payload BLOB,
+        created_at TEXT
+    );
+
+    -- Tokenized inverted index over the searchable text, shadowing the
+    -- memories table (external content: the FTS table stores no copies).
+    -- Text queries become "id IN (SELECT rowid FROM memories_fts WHERE
+    -- memories_fts MATCH ?)" instead of a LIKE scan over every content
+    -- blob; the triggers keep it in sync with writes.
+    CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+        title, content, tags,
+        content='memories', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+        INSERT INTO memories_fts(rowid, title, content, tags)
+        VALUES (new.id, new.title, new.content, new.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, title, content, tags)
+        VALUES ('delete', old.id, old.title, old.content, old.tags);
+    END;
+
+    -- OF clause: score-only updates (the hottest update path) must not
+    -- re-tokenize the row. Dropped first so databases carrying the old
+    -- unconditional trigger pick up the narrowed one.
+    DROP TRIGGER IF EXISTS memories_fts_au;
+    CREATE TRIGGER memories_fts_au
+    AFTER UPDATE OF title, content, tags ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, title, content, tags)
+        VALUES ('delete', old.id, old.title, old.content, old.tags);
+        INSERT INTO memories_fts(rowid, title, content, tags)
+        VALUES (new.id, new.title, new.content, new.tags);
+    END;
+
+    -- Index rows that predate the FTS table (no-op on a fresh database).
+    INSERT INTO memories_fts(memories_fts) VALUES ('rebuild');
+
+    COMMIT;
+"""
 
 
 def init_database(db_path: str = None) -> sqlite3.Connection:
@@ -19,120 +213,91 @@ def init_database(db_path: str = None) -> sqlite3.Connection:
         SQLite connection object
     """
     if db_path is None:
-        db_path = os.path.join(
-            os.path.dirname(__file__), "..", "data", "memory_system.db"
-        )
-        db_path = os.path.abspath(db_path)
+        db_path = _DEFAULT_DB_PATH
 
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=512)
     cursor = conn.cursor()
 
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS memories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            type TEXT NOT NULL,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            tags TEXT,
-            source TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            expires_at TEXT,
-            score REAL DEFAULT 0.0
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS config_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            agent_id TEXT NOT NULL,
-            config_data TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS agent_metrics (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            agent_id TEXT NOT NULL,
-            accuracy REAL DEFAULT 0.0,
-            response_time REAL DEFAULT 0.0,
-            tasks_completed INTEGER DEFAULT 0,
-            timestamp TEXT NOT NULL
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            task_type TEXT NOT NULL,
-            priority TEXT NOT NULL,
-            schedule TEXT,
-            retry_count INTEGER DEFAULT 3,
-            max_retries INTEGER DEFAULT 3,
-            status TEXT NOT NULL,
-            last_run_at TEXT,
-            next_run_at TEXT,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS task_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            task_id INTEGER NOT NULL,
-            status TEXT NOT NULL,
-            started_at TEXT NOT NULL,
-            completed_at TEXT,
-            error_message TEXT,
-            FOREIGN KEY (task_id) REFERENCES tasks(id)
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS reports (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            report_type TEXT NOT NULL,
-            start_date TEXT,
-            end_date TEXT,
-            content TEXT NOT NULL,
-            created_at TEXT NOT NULL
-        )
-    """)
-
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_type ON memories(type)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_source ON memories(source)")
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at)"
-    )
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_tasks_next_run_at ON tasks(next_run_at)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_task_logs_task_id ON task_logs(task_id)"
-    )
-
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_reports_type ON reports(report_type)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports(created_at)"
-    )
+    # WAL + NORMAL drops the rollback-journal fsync pair per commit (the
+    # journal-mode switch is persistent, so the file is created in WAL mode
+    # once and for all); the rest are per-connection read/write tuning.
+    cursor.executescript(_CONNECTION_PRAGMAS)
+
+    # Warm-start fast path: once a database carries the current schema
+    # version, skip the IF NOT EXISTS walk over sqlite_master entirely.
+    cursor.execute("PRAGMA user_version")
+    if cursor.fetchone()[0] == SCHEMA_VERSION:
+        return conn
+
+    # Lowercase shadow columns for case-insensitive LIKE; databases created
+    # before they existed need the ALTERs (errors mean a fresh database —
+    # no table yet — or columns already present; both are fine).
+    for ddl in (
+        "ALTER TABLE memories ADD COLUMN title_lc TEXT GENERATED ALWAYS AS (LOWER(title)) VIRTUAL",
+        "ALTER TABLE memories ADD COLUMN content_lc TEXT GENERATED ALWAYS AS (LOWER(content)) VIRTUAL",
+        "ALTER TABLE memories ADD COLUMN created_epoch INTEGER GENERATED ALWAYS "
+        "AS (CAST(strftime('%s', created_at) AS INTEGER)) VIRTUAL",
+    ):
+        try:
+            cursor.execute(ddl)
+        except sqlite3.OperationalError:
+            pass
+
+    cursor.executescript(_SCHEMA_SQL)
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     conn.commit()
-    print(f"✓ Database initialized at: {db_path}")
+    logger.info("Database initialized at: %s", db_path)
     return conn
 
 
+# Warmed connections keyed by (db_path, thread id) — sqlite3 connections
+# are not thread-safe by default, so each thread gets its own. Reuse keeps
+# the page cache and applied PRAGMAs alive across calls.
+_CONN_CACHE: dict = {}
+
+
+def close_connection(conn: sqlite3.Connection):
+    """
+    Close a connection, refreshing planner statistics first.
+
+    PRAGMA optimize re-runs ANALYZE only for tables whose stats have gone
+    stale — cheap, and it keeps the query planner picking the composite
+    indexes as data distributions drift. Cached connections are evicted so
+    a later get_connection never hands out the closed handle.
+    """
+    for key, cached in list(_CONN_CACHE.items()):
+        if cached is conn:
+            del _CONN_CACHE[key]
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+
+def _close_cached_connections():
+    # Snapshot: close_connection evicts entries as it goes.
+    for conn in list(_CONN_CACHE.values()):
+        try:
+            close_connection(conn)
+        except Exception:
+            pass
+    _CONN_CACHE.clear()
+
+
+atexit.register(_close_cached_connections)
+
+
 def get_connection(db_path: str = None) -> sqlite3.Connection:
     """
     Get a database connection.
 
+    Connections are cached per (db_path, thread) and must not be closed by
+    callers; they are closed once at interpreter exit.
+
     Args:
         db_path: Path to database file. If None, uses default path.
 
@@ -140,16 +305,84 @@ def get_connection(db_path: str = None) -> sqlite3.Connection:
         SQLite connection object
     """
     if db_path is None:
-        db_path = os.path.join(
-            os.path.dirname(__file__), "..", "data", "memory_system.db"
-        )
-        db_path = os.path.abspath(db_path)
+        db_path = _DEFAULT_DB_PATH
+
+    key = (db_path, threading.get_ident())
+    conn = _CONN_CACHE.get(key)
+    if conn is not None:
+        try:
+            conn.total_changes  # raises if the handle was closed behind us
+            return conn
+        except sqlite3.ProgrammingError:
+            del _CONN_CACHE[key]
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=512)
+    conn.executescript(_CONNECTION_PRAGMAS)
     conn.row_factory = sqlite3.Row
+    _CONN_CACHE[key] = conn
     return conn
 
 
+# Memoized INSERT texts per table. Reusing the identical string lets
+# sqlite3's statement cache (sized above) skip the SQL parse/plan on every
+# row after the first.
+_INSERT_SQL_CACHE: dict = {}
+
+
+def bulk_insert(conn: sqlite3.Connection, table: str, columns, rows) -> int:
+    """
+    Insert many rows in one transaction.
+
+    executemany pushes the row loop into the C layer and the surrounding
+    transaction means one fsync for the whole batch instead of one per
+    row — the single biggest SQLite write-throughput lever.
+
+    Args:
+        conn: Open connection
+        table: Target table name
+        columns: Column names matching each row tuple
+        rows: Iterable of value tuples
+
+    Returns:
+        Number of rows inserted
+    """
+    placeholders = ", ".join("?" for _ in columns)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    with conn:
+        cursor = conn.executemany(sql, rows)
+        return cursor.rowcount
+
+
+def get_insert_stmt(conn: sqlite3.Connection, table: str) -> str:
+    """
+    Get a parameterized INSERT statement for a table.
+
+    Columns are introspected once per table (the id primary key and
+    generated columns are excluded) and the SQL text is cached, so every
+    call site binds against the same prepared statement.
+
+    Args:
+        conn: Open connection to the database holding the table
+        table: Table name
+
+    Returns:
+        INSERT INTO ... VALUES (?, ...) SQL string
+    """
+    sql = _INSERT_SQL_CACHE.get(table)
+    if sql is None:
+        cols = [
+            row[1]
+            for row in conn.execute(f"PRAGMA table_info({table})")
+            if row[1] != "id"
+        ]
+        if not cols:
+            raise ValueError(f"Unknown table: {table}")
+        placeholders = ", ".join("?" for _ in cols)
+        sql = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders})"
+        _INSERT_SQL_CACHE[table] = sql
+    return sql
+
+
 if __name__ == "__main__":
     conn = init_database()
     print("✓ All tables created successfully")
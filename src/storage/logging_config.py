@@ -2,10 +2,85 @@
 Logging configuration for Intelligent Memory System
 """
 
+import atexit
 import logging
 import os
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+# Nothing in the format string uses process/thread ids or source location,
+# so skip the os.getpid()/get_ident()/sys._getframe() work each LogRecord
+# would otherwise do on construction.
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+# Default log directory, resolved once at import.
+_DEFAULT_LOG_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "logs")
+)
+
+# One formatter for every handler; built once at import.
+_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    Midnight-rotating file handler with a 64 KiB buffer and lazy flush.
+
+    StreamHandler.emit flushes after every record — one write syscall per
+    log line. Here the buffer is flushed only every FLUSH_INTERVAL records,
+    or immediately for WARNING and above so errors land on disk at once;
+    INFO-heavy workloads batch their writes. Close (and rotation) still
+    flushes everything.
+    """
+
+    FLUSH_INTERVAL = 256
+
+    def __init__(self, *args, **kwargs):
+        self._records_since_flush = 0
+        self._flush_now = True
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=65536,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        self._flush_now = record.levelno >= logging.WARNING
+        super().emit(record)
+
+    def flush(self):
+        self._records_since_flush += 1
+        if self._flush_now or self._records_since_flush >= self.FLUSH_INTERVAL:
+            self._records_since_flush = 0
+            super().flush()
+
+    def close(self):
+        self._flush_now = True
+        super().close()
+
+
+def _stop_listener():
+    """Stop the active queue listener, flushing queued records. Safe to
+    call when no listener is running or it was already stopped."""
+    root_logger = logging.getLogger()
+    listener = getattr(root_logger, "_listener", None)
+    if listener is not None and getattr(listener, "_thread", None) is not None:
+        listener.stop()
+    root_logger._listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(
@@ -24,42 +99,76 @@ def setup_logging(
         log_level: Logging level (default: INFO)
         log_to_console: Whether to log to console
         log_to_file: Whether to log to file
-        max_bytes: Max bytes per log file before rotation
+        max_bytes: Unused; kept for backward compatibility (rotation is
+            time-based, at midnight)
         backup_count: Number of backup files to keep
 
     Returns:
         Root logger instance
     """
     if log_dir is None:
-        log_dir = os.path.join(os.path.dirname(__file__), "..", "logs")
-        log_dir = os.path.abspath(log_dir)
+        log_dir = _DEFAULT_LOG_DIR
 
     os.makedirs(log_dir, exist_ok=True)
 
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    # Repeated calls (tests, reloads) must not stack handlers — each
+    # duplicate multiplies every log line's I/O. Stop any previous
+    # listener and drop existing root handlers before attaching fresh ones.
+    _stop_listener()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+
+    formatter = _FORMATTER
+
+    handlers = []
 
     if log_to_file:
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_file = os.path.join(log_dir, f"memory_system_{today}.log")
+        # One stable filename; the handler renames it with a date suffix at
+        # midnight. Baking the date into the name instead would freeze it at
+        # process start and rotation would never fire. delay=True skips the
+        # open() until the first record arrives.
+        log_file = os.path.join(log_dir, "memory_system.log")
 
-        file_handler = RotatingFileHandler(
-            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        file_handler = BufferedTimedRotatingFileHandler(
+            log_file,
+            when="midnight",
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        # The hot path only enqueues the LogRecord; a listener thread does
+        # the formatting, file writes, and rotation renames, so callers
+        # never block on log I/O.
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        # Keep a reference for the next setup call and the atexit hook;
+        # stop() flushes queued records.
+        root_logger._listener = listener
+
+    # Don't write handler errors to stderr in production. Note for hot
+    # paths: pass %-style args (logger.debug("x=%s", x), never an f-string)
+    # so argument formatting is skipped entirely when the level is off.
+    logging.raiseExceptions = False
 
     return root_logger
 